@@ -21,7 +21,6 @@ from brix.modules.dbt.profile import (
     get_default_profile_path,
     init_profile,
     load_profiles,
-    run_interactive_edit,
     save_profiles,
     update_output,
     update_profile_target,
@@ -183,6 +182,9 @@ def edit(
         brix dbt profile edit --action delete-profile --profile old --force
     """
     if action is None:
+        # Deferred: questionary/prompt_toolkit are only needed for interactive mode
+        from brix.modules.dbt.profile.prompts import run_interactive_edit
+
         run_interactive_edit(profile_path)
         return
 
@@ -6,7 +6,6 @@ from typing import Annotated, Literal
 import typer
 
 from brix.modules.dbt.project.models import HubPackage, PackageNameError, ProjectNameError, validate_hub_package_name
-from brix.modules.dbt.project.prompts import run_dbt_deps, run_interactive_edit, run_interactive_init
 from brix.modules.dbt.project.service import (
     ProjectExistsError,
     fetch_package_versions_parallel,
@@ -123,6 +122,8 @@ def _run_cli_init(
             typer.echo(f"  {f}")
 
         if run_deps is True:
+            from brix.modules.dbt.project.prompts import run_dbt_deps
+
             run_dbt_deps(result.project_path)
         elif run_deps is None and not no_packages:
             typer.echo(f"\nRun 'dbt deps' in {result.project_path} to install packages.")
@@ -258,6 +259,9 @@ def init(
         brix dbt project init -n my_project -p default
     """
     if project_name is None:
+        # Deferred: questionary/prompt_toolkit are only needed for interactive mode
+        from brix.modules.dbt.project.prompts import run_interactive_init
+
         run_interactive_init(profile_path)
         return
 
@@ -625,7 +629,9 @@ def edit(
             --package dbt-labs/dbt_utils
     """
     if action is None:
-        # Interactive mode
+        # Interactive mode (questionary/prompt_toolkit imported on demand)
+        from brix.modules.dbt.project.prompts import run_interactive_edit
+
         run_interactive_edit(project_path)
         return
 
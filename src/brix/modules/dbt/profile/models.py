@@ -6,12 +6,16 @@ Supports DuckDB and Databricks adapters.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from typing_extensions import Self
 
+from brix.utils.yaml import safe_dump, safe_load
+
 
 class DuckDbOutput(BaseModel):
     """DuckDB adapter output configuration.
@@ -37,9 +41,53 @@ class DuckDbOutput(BaseModel):
         return self
 
 
+# Leading http:// or https:// scheme on a Databricks host
+_HOST_PREFIX_RE = re.compile(r"^https?://")
+
 # Authentication method types for Databricks
 DatabricksAuthType = Literal["oauth"]
 
+# Databricks auth settings as bit flags; the validator combines them into one int
+_AUTH_TOKEN = 1 << 0
+_AUTH_OAUTH = 1 << 1
+_AUTH_CLIENT = 1 << 2  # client_id or client_secret set
+_AUTH_CLIENT_COMPLETE = 1 << 3  # client_id and client_secret both non-empty
+_AUTH_AZURE = 1 << 4  # azure_client_id or azure_client_secret set
+_AUTH_AZURE_COMPLETE = 1 << 5  # azure_client_id and azure_client_secret both non-empty
+
+
+def _auth_error(flags: int) -> str | None:
+    """Return the validation error for a combination of auth flags, or None if valid.
+
+    Valid configurations:
+    - token alone (PAT)
+    - auth_type='oauth' alone (U2M)
+    - auth_type='oauth' + client_id + client_secret (M2M AWS/GCP)
+    - auth_type='oauth' + azure_client_id + azure_client_secret (M2M Azure)
+    - nothing at all (token supplied via env var reference, checked by dbt at runtime)
+    """
+    has_oauth = bool(flags & _AUTH_OAUTH)
+    has_client = bool(flags & _AUTH_CLIENT)
+    has_azure = bool(flags & _AUTH_AZURE)
+
+    if flags & _AUTH_TOKEN:
+        if has_oauth or has_client or has_azure:
+            return "Cannot use token authentication with OAuth settings"
+        return None
+    if not has_oauth:
+        return "OAuth credentials require auth_type='oauth'" if has_client or has_azure else None
+    if has_client:
+        if not flags & _AUTH_CLIENT_COMPLETE:
+            return "Both client_id and client_secret are required for OAuth M2M (AWS/GCP)"
+        return "Cannot mix AWS/GCP and Azure OAuth credentials" if has_azure else None
+    if has_azure and not flags & _AUTH_AZURE_COMPLETE:
+        return "Both azure_client_id and azure_client_secret are required for OAuth M2M (Azure)"
+    return None
+
+
+# Every invalid flag combination mapped to its error, precomputed so validation is one dict lookup
+_AUTH_ERRORS: dict[int, str] = {flags: msg for flags in range(1 << 6) if (msg := _auth_error(flags)) is not None}
+
 
 class DatabricksOutput(BaseModel):
     """Databricks adapter output configuration.
@@ -79,18 +127,15 @@ class DatabricksOutput(BaseModel):
     def strip_host_protocol(cls, v: str) -> str:
         """Strip http:// or https:// prefix from host if present."""
         if isinstance(v, str):
-            if v.startswith("https://"):
-                return v[8:]
-            if v.startswith("http://"):
-                return v[7:]
+            return _HOST_PREFIX_RE.sub("", v, count=1)
         return v
 
     @field_validator("http_path", mode="before")
     @classmethod
     def ensure_http_path_starts_with_slash(cls, v: str) -> str:
         """Ensure http_path starts with /."""
-        if isinstance(v, str) and not v.startswith("/"):
-            return f"/{v}"
+        if isinstance(v, str):
+            return f"/{v.removeprefix('/')}"
         return v
 
     @field_validator("threads", mode="after")
@@ -113,54 +158,20 @@ class DatabricksOutput(BaseModel):
 
     @model_validator(mode="after")
     def validate_auth_method(self) -> Self:
-        """Validate that exactly one authentication method is configured.
+        """Validate that at most one authentication method is configured.
 
-        Valid configurations:
-        - token alone (PAT)
-        - auth_type='oauth' alone (U2M)
-        - auth_type='oauth' + client_id + client_secret (M2M AWS/GCP)
-        - auth_type='oauth' + azure_client_id + azure_client_secret (M2M Azure)
+        See ``_auth_error`` for the accepted combinations.
         """
-        has_token = self.token is not None
-        has_oauth = self.auth_type == "oauth"
-        has_client_creds = self.client_id is not None or self.client_secret is not None
-        has_azure_creds = self.azure_client_id is not None or self.azure_client_secret is not None
-
-        # Token-based auth
-        if has_token:
-            if has_oauth or has_client_creds or has_azure_creds:
-                msg = "Cannot use token authentication with OAuth settings"
-                raise ValueError(msg)
-            return self
-
-        # OAuth-based auth
-        if has_oauth:
-            # Validate client credentials are complete if provided
-            if has_client_creds:
-                if not (self.client_id and self.client_secret):
-                    msg = "Both client_id and client_secret are required for OAuth M2M (AWS/GCP)"
-                    raise ValueError(msg)
-                if has_azure_creds:
-                    msg = "Cannot mix AWS/GCP and Azure OAuth credentials"
-                    raise ValueError(msg)
-                return self
-
-            # Validate Azure credentials are complete if provided
-            if has_azure_creds:
-                if not (self.azure_client_id and self.azure_client_secret):
-                    msg = "Both azure_client_id and azure_client_secret are required for OAuth M2M (Azure)"
-                    raise ValueError(msg)
-                return self
-
-            # U2M OAuth (no credentials needed)
-            return self
-
-        # No auth configured - allow this for profiles with env var references
-        # The connection test will catch invalid configurations at runtime
-        if has_client_creds or has_azure_creds:
-            msg = "OAuth credentials require auth_type='oauth'"
+        flags = (
+            _AUTH_TOKEN * (self.token is not None)
+            | _AUTH_OAUTH * (self.auth_type == "oauth")
+            | _AUTH_CLIENT * (self.client_id is not None or self.client_secret is not None)
+            | _AUTH_CLIENT_COMPLETE * bool(self.client_id and self.client_secret)
+            | _AUTH_AZURE * (self.azure_client_id is not None or self.azure_client_secret is not None)
+            | _AUTH_AZURE_COMPLETE * bool(self.azure_client_id and self.azure_client_secret)
+        )
+        if msg := _AUTH_ERRORS.get(flags):
             raise ValueError(msg)
-
         return self
 
 
@@ -177,6 +188,10 @@ class ProfileTarget(BaseModel):
     outputs: dict[str, OutputConfig]
 
 
+# Validator for the profiles mapping, built once and reused by every from_yaml() call
+_PROFILES_ADAPTER: TypeAdapter[dict[str, ProfileTarget]] = TypeAdapter(dict[str, ProfileTarget])
+
+
 class DbtProfiles(BaseModel):
     """Root model for profiles.yml - a mapping of profile names to configurations."""
 
@@ -205,10 +220,31 @@ class DbtProfiles(BaseModel):
         Raises:
             ValueError: If YAML is invalid or doesn't match schema
         """
-        import yaml
+        return cls._from_yaml_source(content)
 
+    @classmethod
+    def from_yaml_bytes(cls, content: bytes) -> DbtProfiles:
+        """Parse profiles from raw YAML bytes.
+
+        libyaml detects the encoding itself, so the content never goes through
+        a Python-level decode.
+
+        Args:
+            content: Raw bytes of profiles.yml
+
+        Returns:
+            Parsed DbtProfiles instance
+
+        Raises:
+            ValueError: If YAML is invalid or doesn't match schema
+        """
+        return cls._from_yaml_source(content)
+
+    @classmethod
+    def _from_yaml_source(cls, content: str | bytes) -> DbtProfiles:
+        """Parse and validate profiles from YAML text or bytes."""
         try:
-            data = yaml.safe_load(content)
+            data = safe_load(content)
         except yaml.YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
@@ -217,7 +253,8 @@ class DbtProfiles(BaseModel):
             msg = "profiles.yml must be a YAML mapping"
             raise ValueError(msg)
 
-        return cls(root=data)
+        # Validate the mapping directly; the root wrapper itself has nothing to check
+        return cls.model_construct(root=_PROFILES_ADAPTER.validate_python(data))
 
     @classmethod
     def from_file(cls, path: Path) -> DbtProfiles:
@@ -233,8 +270,7 @@ class DbtProfiles(BaseModel):
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML is invalid or doesn't match schema
         """
-        content = path.read_text()
-        return cls.from_yaml(content)
+        return cls.from_yaml_bytes(path.read_bytes())
 
     def to_yaml(self) -> str:
         """Serialize profiles to YAML string.
@@ -242,9 +278,7 @@ class DbtProfiles(BaseModel):
         Returns:
             YAML string representation
         """
-        import yaml
-
-        # Convert to dict, handling nested models
+        # Dump the whole tree in one pydantic-core call (python mode keeps native types for the dumper)
         # Use by_alias=True to output 'schema' instead of 'schema_'
-        data = {name: profile.model_dump(exclude_none=True, by_alias=True) for name, profile in self.root.items()}
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        data = self.model_dump(exclude_none=True, by_alias=True)["root"]
+        return safe_dump(data)
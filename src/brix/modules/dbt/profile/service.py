@@ -5,6 +5,9 @@ Handles loading templates, validating profiles, and writing to disk.
 
 from __future__ import annotations
 
+import functools
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
@@ -14,8 +17,6 @@ from brix.modules.dbt.profile.models import DbtProfiles
 from brix.templates import get_template
 from brix.utils.logging import get_logger
 
-DEFAULT_PROFILE_PATH = Path.home() / ".dbt" / "profiles.yml"
-
 
 class ProfileConfig(BaseSettings):
     """Profile configuration from environment variables.
@@ -32,19 +33,48 @@ class ProfileConfig(BaseSettings):
     profile_path: Path | None = None
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_default_profile_path(env_value: str | None, home: str) -> Path:
+    """Resolve the profile path for an env var value and home directory.
+
+    Cached on both inputs, so a changed env var or HOME resolves afresh.
+    """
+    config = ProfileConfig(profile_path=env_value or None)
+    return config.profile_path or Path(home) / ".dbt" / "profiles.yml"
+
+
 def get_default_profile_path() -> Path:
     """Get the default profile path, checking env var first.
 
     Returns:
         Path from BRIX_DBT_PROFILE_PATH env var, or ~/.dbt/profiles.yml
     """
-    config = ProfileConfig()
-    return config.profile_path or DEFAULT_PROFILE_PATH
+    # Match ProfileConfig's case_sensitive=False: the explicit value passed below bypasses its env lookup
+    env_value = next((os.environ[key] for key in os.environ if key.upper() == "BRIX_DBT_PROFILE_PATH"), None)
+    return _resolve_default_profile_path(env_value, str(Path.home()))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_text(template_name: str) -> str:
+    """Read a bundled template once per process."""
+    return get_template(template_name)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_template(template_name: str) -> DbtProfiles:
+    """Parse and validate a bundled template once per process.
+
+    The cached instance is shared; callers must copy it before handing it out.
+    """
+    return DbtProfiles.from_yaml(_load_template_text(template_name))
 
 
 def load_template(template_name: str = "profiles.yml") -> tuple[str, DbtProfiles]:
     """Load and validate the bundled profile template.
 
+    Reading and parsing are cached per template name, so repeated calls only
+    pay for a deep copy of the parsed profiles.
+
     Args:
         template_name: Name of the template file
 
@@ -58,8 +88,8 @@ def load_template(template_name: str = "profiles.yml") -> tuple[str, DbtProfiles
     logger = get_logger()
     logger.debug("Loading template: %s", template_name)
 
-    content = get_template(template_name)
-    profiles = DbtProfiles.from_yaml(content)
+    content = _load_template_text(template_name)
+    profiles = _parse_template(template_name).model_copy(deep=True)
 
     logger.debug("Template validated successfully")
     return content, profiles
@@ -69,29 +99,14 @@ class ProfileExistsError(Exception):
     """Raised when profile already exists and force is not set."""
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ProfileInitResult:
     """Result of profile initialization."""
 
-    def __init__(
-        self,
-        *,
-        success: bool,
-        path: Path,
-        action: Literal["created", "overwritten", "skipped"],
-        message: str,
-    ) -> None:
-        """Initialize profile init result.
-
-        Args:
-            success: Whether initialization succeeded
-            path: Path to the profile file
-            action: What action was taken (created, overwritten, skipped)
-            message: Human-readable result message
-        """
-        self.success = success
-        self.path = path
-        self.action = action
-        self.message = message
+    success: bool
+    path: Path
+    action: Literal["created", "overwritten", "skipped"]
+    message: str
 
 
 def init_profile(
@@ -126,8 +141,9 @@ def init_profile(
         msg = f"Profile already exists at {target_path}. Use --force to overwrite."
         raise ProfileExistsError(msg)
 
-    # Load and validate template
-    content, _ = load_template(template_name)
+    # Load and validate template (no copy needed, only the raw content is written)
+    _parse_template(template_name)
+    content = _load_template_text(template_name)
 
     # Ensure parent directory exists
     target_path.parent.mkdir(parents=True, exist_ok=True)
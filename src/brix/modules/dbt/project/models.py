@@ -13,6 +13,8 @@ from typing import Annotated, Any, Literal
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from brix.utils.yaml import safe_dump, safe_load
+
 # Project name validation regex - must start with letter/underscore, contain only alphanumeric/underscore
 PROJECT_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
@@ -127,7 +129,7 @@ class DbtProject(BaseModel):
             ValueError: If YAML is invalid or doesn't match schema
         """
         try:
-            data = yaml.safe_load(content)
+            data = safe_load(content)
         except yaml.YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
@@ -163,7 +165,7 @@ class DbtProject(BaseModel):
         """
         # Convert to dict, using aliases for YAML keys
         data = self.model_dump(exclude_none=True, by_alias=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return safe_dump(data)
 
 
 # Package type models for packages.yml
@@ -245,7 +247,7 @@ class DbtPackages(BaseModel):
             ValueError: If YAML is invalid or doesn't match schema
         """
         try:
-            data = yaml.safe_load(content)
+            data = safe_load(content)
         except yaml.YAMLError as e:
             msg = f"Invalid YAML: {e}"
             raise ValueError(msg) from e
@@ -283,7 +285,7 @@ class DbtPackages(BaseModel):
             YAML string representation
         """
         data = self.model_dump(exclude_none=True)
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return safe_dump(data)
 
     def add_hub_package(self, package: str, version: str) -> None:
         """Add a hub package to the list.
@@ -7,11 +7,14 @@ from brix.utils.logging import (
     reset_logger,
     setup_logging,
 )
+from brix.utils.yaml import safe_dump, safe_load
 
 __all__ = [
     "LogConfig",
     "LogLevel",
     "get_logger",
     "reset_logger",
+    "safe_dump",
+    "safe_load",
     "setup_logging",
 ]
@@ -11,17 +11,21 @@ f-strings elsewhere. This is Python logging best practice.
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import math
+import os
+import queue
 import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import IntEnum
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-from pydantic import field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
 if TYPE_CHECKING:
     from typing import Any
 
@@ -44,7 +48,28 @@ class LogLevel(IntEnum):
     OFF = 100
 
 
-class LogConfig(BaseSettings):
+LogLevelName = Literal["TRACE", "DEBUG", "INFO", "WARN", "ERROR", "OFF"]
+
+# Accepted BRIX_LOG values (upper-cased) mapped to their level name; WARNING is an alias for WARN
+_LOG_LEVEL_NAMES: dict[str, LogLevelName] = {
+    "TRACE": "TRACE",
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "WARN": "WARN",
+    "WARNING": "WARN",
+    "ERROR": "ERROR",
+    "OFF": "OFF",
+}
+
+# Accepted BRIX_LOG_JSON values (lower-cased)
+_BOOL_VALUES: dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y", "on"), True),
+    **dict.fromkeys(("0", "false", "f", "no", "n", "off"), False),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LogConfig:
     """Logging configuration from environment variables.
 
     Environment variables:
@@ -53,39 +78,69 @@ class LogConfig(BaseSettings):
         BRIX_LOG_JSON: Enable JSON format (true/false)
     """
 
-    model_config = SettingsConfigDict(
-        env_prefix="BRIX_",
-        case_sensitive=False,
-    )
-
-    log: Literal["TRACE", "DEBUG", "INFO", "WARN", "ERROR", "OFF"] = "ERROR"
-    log_path: Path | None = None
-    log_json: bool = False
+    log: LogLevelName
+    log_path: Path | None
+    log_json: bool
 
-    @field_validator("log", mode="before")
     @classmethod
-    def normalize_log_level(cls, v: str) -> str:
-        """Normalize log level to uppercase."""
-        if isinstance(v, str):
-            v = v.upper()
-            # Handle WARNING -> WARN alias
-            if v == "WARNING":
-                return "WARN"
-        return v
+    def from_env(cls) -> LogConfig:
+        """Read the configuration from the environment (variable names are case-insensitive).
+
+        Returns:
+            LogConfig with defaults for unset or empty variables
+
+        Raises:
+            ValueError: If BRIX_LOG or BRIX_LOG_JSON has an unrecognized value
+        """
+        # Iterate keys only: items() would decode every value in the environment
+        env = {key.upper(): os.environ[key] for key in os.environ if key[:5].upper() == "BRIX_"}
+
+        raw_level = env.get("BRIX_LOG") or "ERROR"
+        level = _LOG_LEVEL_NAMES.get(raw_level.upper())
+        if level is None:
+            msg = f"Invalid BRIX_LOG value '{raw_level}'. Expected one of: TRACE, DEBUG, INFO, WARN, ERROR, OFF"
+            raise ValueError(msg)
+
+        raw_json = env.get("BRIX_LOG_JSON") or "false"
+        log_json = _BOOL_VALUES.get(raw_json.lower())
+        if log_json is None:
+            msg = f"Invalid BRIX_LOG_JSON value '{raw_json}'. Expected true or false"
+            raise ValueError(msg)
+
+        raw_path = env.get("BRIX_LOG_PATH")
+        return cls(log=level, log_path=Path(raw_path) if raw_path else None, log_json=log_json)
 
 
 # Timestamp format: ISO8601/RFC3339 for machine parseability and timezone clarity
 class BrixFormatter(logging.Formatter):
     """Human-readable log formatter for console output.
 
-    Format: ``[2024-01-15T10:30:45Z] [DEBUG] message``
+    Format: ``[2024-01-15T10:30:45.123456+00:00] [DEBUG] message``
+
+    The date and time part of the timestamp only changes once per second, so it
+    is rendered once and reused for every record logged within that second.
     """
 
+    def __init__(self) -> None:
+        """Initialize the formatter with an empty timestamp cache."""
+        super().__init__()
+        # (epoch second, "[YYYY-MM-DDTHH:MM:SS" prefix); one tuple so threads never see a torn pair
+        self._second_prefix: tuple[int, str] = (-1, "")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as human-readable text."""
-        timestamp = datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
-        level = record.levelname
-        return f"[{timestamp}] [{level}] {record.getMessage()}"
+        # Split and round like datetime.fromtimestamp so the text matches the JSON formatter's isoformat()
+        frac, whole = math.modf(record.created)
+        second, micros = int(whole), round(frac * 1_000_000)
+        if micros >= 1_000_000:
+            second, micros = second + 1, micros - 1_000_000
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, tz=timezone.utc).strftime("[%Y-%m-%dT%H:%M:%S")
+            self._second_prefix = (second, prefix)
+        # isoformat() omits the fraction entirely when it is zero
+        fraction = f".{micros:06d}" if micros else ""
+        return f"{prefix}{fraction}+00:00] [{record.levelname}] {record.getMessage()}"
 
 
 class BrixJsonFormatter(logging.Formatter):
@@ -107,11 +162,84 @@ class BrixJsonFormatter(logging.Formatter):
         return json.dumps(log_obj)
 
 
+# The formatters hold no per-handler configuration (BrixFormatter's timestamp cache is
+# thread-safe and handler-independent), so every handler shares one instance of each
+_TEXT_FORMATTER = BrixFormatter()
+_JSON_FORMATTER = BrixJsonFormatter()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes instead of flushing after every record.
+
+    Records below ERROR stay in the file object's write buffer until it fills or
+    the handler is closed; ERROR and above flush immediately so failures are on
+    disk right away.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing only for errors."""
+        if self.stream is None:
+            self.stream = self._open()
+        # Same error handling as logging.StreamHandler.emit, minus the per-record flush
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BrixQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the handler behind the queue.
+
+    The stdlib ``prepare`` formats the record with a default formatter and drops
+    ``exc_info``, which would lose the ``@exception`` field of JSON log files.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments so the record is safe to format later."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 # Thread-safe singleton logger
 _logger: logging.Logger | None = None
+_listener: QueueListener | None = None
 _lock = threading.Lock()
 
 
+def _start_queue_listener(handler: logging.Handler) -> QueueHandler:
+    """Move a handler behind a queue so its writes happen on a background thread.
+
+    Returns:
+        The queue handler to attach to the logger in place of ``handler``
+    """
+    global _listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _BrixQueueHandler(log_queue)
+
+
+def _stop_queue_listener() -> None:
+    """Write out any queued records, stop the background thread, and close its handlers."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+# Queued log records must reach the log file before the process exits
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     level: str | None = None,
     log_path: Path | None = None,
@@ -137,7 +265,7 @@ def setup_logging(
             return _logger
 
         # Load config from env vars
-        config = LogConfig()
+        config = LogConfig.from_env()
 
         # Apply CLI overrides
         effective_level = level.upper() if level else config.log
@@ -157,21 +285,22 @@ def setup_logging(
         console_handler = logging.StreamHandler()
         if effective_json and not effective_path:
             # JSON to console only if no file path and JSON requested
-            console_handler.setFormatter(BrixJsonFormatter())
+            console_handler.setFormatter(_JSON_FORMATTER)
         else:
-            console_handler.setFormatter(BrixFormatter())
+            console_handler.setFormatter(_TEXT_FORMATTER)
         _logger.addHandler(console_handler)
 
         # File handler (JSON by default for machine parsing, unless explicitly disabled)
+        # Disk writes go through a queue; the console stays synchronous so stderr output keeps its order
         if effective_path:
-            file_handler = logging.FileHandler(effective_path)
+            file_handler = BufferedFileHandler(effective_path)
             # Use JSON for files unless json_format was explicitly set to False
             use_json_for_file = json_format is not False
             if use_json_for_file:
-                file_handler.setFormatter(BrixJsonFormatter())
+                file_handler.setFormatter(_JSON_FORMATTER)
             else:
-                file_handler.setFormatter(BrixFormatter())
-            _logger.addHandler(file_handler)
+                file_handler.setFormatter(_TEXT_FORMATTER)
+            _logger.addHandler(_start_queue_listener(file_handler))
 
         return _logger
 
@@ -191,6 +320,7 @@ def reset_logger() -> None:
     """Reset the logger singleton (for testing)."""
     global _logger
     with _lock:
+        _stop_queue_listener()
         if _logger is not None:
             _logger.handlers.clear()
             _logger = None
@@ -0,0 +1,42 @@
+"""Safe YAML loading and dumping shared by the dbt profile and project models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+# Use libyaml's C loader/dumper when PyYAML was built with it (much faster parsing)
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+
+def safe_load(content: str | bytes) -> Any:  # noqa: ANN401 - YAML documents can hold any value
+    """Parse a YAML document with the safe loader.
+
+    Args:
+        content: YAML text, or raw bytes whose encoding libyaml detects itself
+
+    Returns:
+        The parsed document
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return yaml.load(content, Loader=_SafeLoader)
+
+
+def safe_dump(data: Any) -> str:  # noqa: ANN401 - YAML documents can hold any value
+    """Serialize data to block-style YAML, keeping the key order of the input.
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars)
+
+    Returns:
+        YAML string representation
+    """
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
@@ -1,20 +1,23 @@
 """Version update checker using GitHub releases."""
 
+import functools
 import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import httpx
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 from pydantic import BaseModel, ValidationError
 
 from brix import __version__
 from brix.utils.logging import get_logger
 
 GITHUB_REPO = "Spycner/brix"
+RELEASES_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 CACHE_DIR = Path.home() / ".cache" / "brix"
 CACHE_FILE = CACHE_DIR / "version_check.json"
 CHECK_INTERVAL = timedelta(hours=24)
+_CHECK_INTERVAL_SECONDS = CHECK_INTERVAL.total_seconds()
 
 
 class VersionCache(BaseModel):
@@ -32,14 +35,17 @@ class GitHubRelease(BaseModel):
 
 def _fetch_and_cache_latest() -> None:
     """Fetch latest version from GitHub and cache it (runs in background thread)."""
+    # Imported here: httpx is only needed when the cache is stale and adds ~60ms to CLI startup
+    import httpx
+
     logger = get_logger()
-    url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-    logger.debug("Fetching latest version from %s", url)
+    logger.debug("Fetching latest version from %s", RELEASES_URL)
     try:
-        resp = httpx.get(url, timeout=5.0, follow_redirects=True)
+        # One request per process, so a shared httpx.Client would only add import-time setup
+        resp = httpx.get(RELEASES_URL, timeout=5.0, follow_redirects=True)
         resp.raise_for_status()
         release = GitHubRelease.model_validate(resp.json())
-        latest = release.tag_name.lstrip("v")
+        latest = release.tag_name.removeprefix("v")
         logger.debug("Latest version from GitHub: %s", latest)
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version=latest)
@@ -52,14 +58,20 @@ def _fetch_and_cache_latest() -> None:
 def _load_cache() -> VersionCache | None:
     """Load cached version check result."""
     logger = get_logger()
-    if not CACHE_FILE.exists():
+    try:
+        # One read instead of exists() + read; pydantic parses the raw bytes without a decode step
+        content = CACHE_FILE.read_bytes()
+    except FileNotFoundError:
         logger.debug("Version cache file not found: %s", CACHE_FILE)
         return None
+    except OSError as e:
+        logger.debug("Failed to load version cache: %s", e)
+        return None
     try:
-        cache = VersionCache.model_validate_json(CACHE_FILE.read_text())
+        cache = VersionCache.model_validate_json(content)
         logger.debug("Loaded version cache: %s (checked %s)", cache.latest_version, cache.last_check)
         return cache
-    except (ValidationError, OSError) as e:
+    except ValidationError as e:
         logger.debug("Failed to load version cache: %s", e)
         return None
 
@@ -68,7 +80,17 @@ def _should_refresh(cache: VersionCache | None) -> bool:
     """Check if cache is stale and needs refresh."""
     if cache is None:
         return True
-    return datetime.now(timezone.utc) - cache.last_check > CHECK_INTERVAL
+    # Compare epoch floats: cheaper than building an aware datetime.now() and a timedelta on every startup
+    return time.time() - cache.last_check.timestamp() > _CHECK_INTERVAL_SECONDS
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_version(version: str) -> Version | None:
+    """Parse a version string once per distinct value, returning None if it is not PEP 440."""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
 
 
 def check_for_updates() -> str | None:
@@ -87,7 +109,14 @@ def check_for_updates() -> str | None:
         thread.start()
 
     # Return cached result immediately (or None if no cache yet)
-    if cache and Version(cache.latest_version) > Version(__version__):
+    if cache is None:
+        return None
+    latest = _parse_version(cache.latest_version)
+    current = _parse_version(__version__)
+    if latest is None or current is None:
+        logger.debug("Cannot compare versions: %s vs %s", __version__, cache.latest_version)
+        return None
+    if latest > current:
         logger.debug("Update available: %s -> %s", __version__, cache.latest_version)
         return cache.latest_version
     return None
@@ -1,11 +1,24 @@
 """Shared pytest fixtures for brix tests."""
 
+import re
+import shutil
+
+import click
 import pytest
+import typer
 
 from brix import version_check
 from brix.utils.logging import reset_logger
 
 
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach each phase's report to the test item (read by ``fast_tmp``)."""
+    report = yield
+    setattr(item, f"rep_{report.when}", report)
+    return report
+
+
 @pytest.fixture(autouse=True)
 def reset_logger_fixture():
     """Reset logger before and after each test."""
@@ -14,6 +27,58 @@ def reset_logger_fixture():
     reset_logger()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolate_version_check(tmp_path_factory):
+    """Keep CLI invocations off the network and away from the real version cache.
+
+    Every ``brix`` invocation runs ``check_for_updates()``, which would otherwise
+    read ``~/.cache/brix`` and start a thread fetching from GitHub. Session-scoped
+    so it is in place before session fixtures that render CLI help. Tests that
+    exercise the version check override these with ``temp_cache_dir`` or call
+    ``_fetch_and_cache_latest`` directly.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(version_check, "CACHE_FILE", tmp_path_factory.getbasetemp() / "no_version_cache.json")
+        mp.setattr(version_check, "_fetch_and_cache_latest", lambda: None)
+        yield
+
+
+@pytest.fixture(scope="session")
+def click_app() -> click.Command:
+    """Click command tree for the brix app, converted from Typer once per session.
+
+    Invoke it with ``click.testing.CliRunner`` rather than Typer's runner, which
+    rebuilds the tree on every call.
+    """
+    from brix.main import app
+
+    return typer.main.get_command(app)
+
+
+@pytest.fixture(scope="session")
+def default_profiles_content() -> str:
+    """Raw content of the bundled profiles.yml template, loaded once per session."""
+    from brix.modules.dbt.profile import load_template
+
+    content, _ = load_template()
+    return content
+
+
+@pytest.fixture
+def fast_tmp(tmp_path_factory, request):
+    """Per-test directory inside one shared session directory.
+
+    Cheaper than ``tmp_path`` for tests that only need scratch space. The
+    directory is removed when the test passes and kept on failure for inspection.
+    """
+    path = tmp_path_factory.getbasetemp() / "fast" / re.sub(r"[^\w.-]", "_", request.node.nodeid)
+    path.mkdir(parents=True)
+    yield path
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 @pytest.fixture
 def temp_cache_dir(tmp_path, monkeypatch):
     """Use temporary directory for version check cache."""
@@ -13,6 +13,8 @@ from brix.modules.dbt import run_dbt
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 DBT_PROJECT_DIR = FIXTURES_DIR / "dbt_project"
 
+pytestmark = [pytest.mark.slow, pytest.mark.integration]
+
 runner = CliRunner()
 
 
@@ -24,7 +26,6 @@ def dbt_project(tmp_path):
     return project_dir
 
 
-@pytest.mark.integration
 class TestDbtIntegration:
     """Integration tests that actually run dbt commands."""
 
@@ -49,7 +50,6 @@ class TestDbtIntegration:
         assert exit_code == 0
 
 
-@pytest.mark.integration
 class TestBrixDbtIntegration:
     """Integration tests for dbt passthrough via the brix CLI."""
 
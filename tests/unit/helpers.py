@@ -0,0 +1,56 @@
+"""Helpers for calling CLI command functions directly in unit tests.
+
+Calling the command function skips Click's argument parsing and context setup,
+which is all ``CliRunner`` adds for tests that only check a command's behavior.
+Keep at least one ``CliRunner`` test per command group to cover the Typer wiring.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pytest
+import typer
+
+from brix.commands.dbt import profile as profile_commands
+
+
+class CommandResult(NamedTuple):
+    """Exit code and combined stdout/stderr of a command call."""
+
+    exit_code: int
+    output: str
+
+
+def call_command(capsys: pytest.CaptureFixture[str], command: Callable[..., Any], **kwargs: Any) -> CommandResult:
+    """Call a Typer command function, translating ``typer.Exit`` into an exit code."""
+    try:
+        command(**kwargs)
+        exit_code = 0
+    except typer.Exit as e:
+        exit_code = e.exit_code
+    captured = capsys.readouterr()
+    return CommandResult(exit_code, captured.out + captured.err)
+
+
+def invoke_profile_init(
+    capsys: pytest.CaptureFixture[str], path: Path | None = None, *, force: bool = False
+) -> CommandResult:
+    """Run ``brix dbt profile init`` without going through Click."""
+    return call_command(capsys, profile_commands.init, profile_path=path, force=force)
+
+
+def invoke_profile_show(capsys: pytest.CaptureFixture[str]) -> CommandResult:
+    """Run ``brix dbt profile show`` without going through Click."""
+    return call_command(capsys, profile_commands.show)
+
+
+def invoke_profile_edit(
+    capsys: pytest.CaptureFixture[str], path: Path, action: str, **options: str | int | bool | None
+) -> CommandResult:
+    """Run ``brix dbt profile edit`` in CLI mode without going through Click.
+
+    ``options`` use the ``edit`` parameter names (``profile``, ``output``, ``target``,
+    ``path_value``, ``threads``, ``force``) rather than the command-line flags.
+    """
+    return call_command(capsys, profile_commands.edit, profile_path=path, action=action, **options)
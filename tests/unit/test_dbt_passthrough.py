@@ -3,11 +3,11 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import click
+from click.testing import CliRunner
 
 import brix.commands.dbt as dbt_command_module
 import brix.modules.dbt.passthrough as passthrough_module
-from brix.main import app
 from brix.modules.dbt import CachedPathNotFoundError, load_project_cache, run_dbt, save_project_cache
 
 runner = CliRunner()
@@ -57,13 +57,13 @@ class TestRunDbt:
 
 
 class TestProjectPathCache:
-    def test_save_and_load_cache(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_save_and_load_cache(self, fast_tmp: Path, monkeypatch: MagicMock):
         """Test saving and loading project path cache."""
-        cache_dir = tmp_path / ".cache" / "brix"
+        cache_dir = fast_tmp / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
         monkeypatch.setattr(passthrough_module, "PROJECT_CACHE_FILE", cache_dir / "dbt_project_path.json")
 
-        project_dir = tmp_path / "my_project"
+        project_dir = fast_tmp / "my_project"
         project_dir.mkdir()
 
         save_project_cache(project_dir)
@@ -71,14 +71,14 @@ class TestProjectPathCache:
 
         assert loaded == project_dir.resolve()
 
-    def test_load_cache_nonexistent_path_raises(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_load_cache_nonexistent_path_raises(self, fast_tmp: Path, monkeypatch: MagicMock):
         """Test loading cache raises CachedPathNotFoundError when cached path doesn't exist."""
-        cache_dir = tmp_path / ".cache" / "brix"
+        cache_dir = fast_tmp / ".cache" / "brix"
         cache_dir.mkdir(parents=True)
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
         monkeypatch.setattr(passthrough_module, "PROJECT_CACHE_FILE", cache_dir / "dbt_project_path.json")
 
-        project_dir = tmp_path / "my_project"
+        project_dir = fast_tmp / "my_project"
         project_dir.mkdir()
         save_project_cache(project_dir)
 
@@ -90,46 +90,40 @@ class TestProjectPathCache:
         with pytest.raises(CachedPathNotFoundError, match="no longer exists"):
             load_project_cache()
 
-    def test_load_cache_no_cache_file(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_load_cache_no_cache_file(self, fast_tmp: Path, monkeypatch: MagicMock):
         """Test loading cache returns None when no cache file exists."""
-        cache_dir = tmp_path / ".cache" / "brix"
+        cache_dir = fast_tmp / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
         monkeypatch.setattr(passthrough_module, "PROJECT_CACHE_FILE", cache_dir / "dbt_project_path.json")
 
         result = load_project_cache()
         assert result is None
 
-    def test_relative_path_converted_to_absolute(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_relative_path_converted_to_absolute(self, fast_tmp: Path, monkeypatch: MagicMock):
         """Test relative paths are converted to absolute before caching."""
-        import os
-
-        cache_dir = tmp_path / ".cache" / "brix"
+        cache_dir = fast_tmp / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
         monkeypatch.setattr(passthrough_module, "PROJECT_CACHE_FILE", cache_dir / "dbt_project_path.json")
 
-        project_dir = tmp_path / "my_project"
+        project_dir = fast_tmp / "my_project"
         project_dir.mkdir()
 
-        # Change to tmp_path and use relative path
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(tmp_path)
-            save_project_cache(Path("my_project"))
-            loaded = load_project_cache()
-            assert loaded is not None
-            assert loaded.is_absolute()
-            assert loaded == project_dir.resolve()
-        finally:
-            os.chdir(original_cwd)
+        # Change to fast_tmp (restored by monkeypatch) and use relative path
+        monkeypatch.chdir(fast_tmp)
+        save_project_cache(Path("my_project"))
+        loaded = load_project_cache()
+        assert loaded is not None
+        assert loaded.is_absolute()
+        assert loaded == project_dir.resolve()
 
 
 class TestDbtCommand:
-    def test_dbt_command_exists(self):
-        result = runner.invoke(app, ["dbt", "--help"])
+    def test_dbt_command_exists(self, click_app: click.Command):
+        result = runner.invoke(click_app, ["dbt", "--help"])
         assert result.exit_code == 0
         assert "dbt" in result.output.lower()
 
-    def test_dbt_passthrough_args(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_dbt_passthrough_args(self, tmp_path: Path, monkeypatch: MagicMock, click_app: click.Command):
         """Test passthrough with --project option."""
         cache_dir = tmp_path / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
@@ -139,11 +133,11 @@ class TestDbtCommand:
         project_dir.mkdir()
 
         with patch.object(dbt_command_module, "run_dbt", return_value=0) as mock_run_dbt:
-            result = runner.invoke(app, ["dbt", "--project", str(project_dir), "run", "--select", "my_model"])
+            result = runner.invoke(click_app, ["dbt", "--project", str(project_dir), "run", "--select", "my_model"])
             mock_run_dbt.assert_called_once_with(["run", "--select", "my_model"], project_path=project_dir.resolve())
             assert result.exit_code == 0
 
-    def test_dbt_preserves_exit_code(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_dbt_preserves_exit_code(self, tmp_path: Path, monkeypatch: MagicMock, click_app: click.Command):
         cache_dir = tmp_path / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
         monkeypatch.setattr(passthrough_module, "PROJECT_CACHE_FILE", cache_dir / "dbt_project_path.json")
@@ -152,18 +146,20 @@ class TestDbtCommand:
         project_dir.mkdir()
 
         with patch.object(dbt_command_module, "run_dbt", return_value=2):
-            result = runner.invoke(app, ["dbt", "--project", str(project_dir), "run"])
+            result = runner.invoke(click_app, ["dbt", "--project", str(project_dir), "run"])
             assert result.exit_code == 2
 
-    def test_custom_command_not_passed_through(self):
+    def test_custom_command_not_passed_through(self, click_app: click.Command):
         """Custom commands like 'profile' should not be passed to dbt."""
         with patch.object(dbt_command_module, "run_dbt", return_value=0) as mock_run_dbt:
-            result = runner.invoke(app, ["dbt", "profile", "-h"])
+            result = runner.invoke(click_app, ["dbt", "profile", "-h"])
             assert result.exit_code == 0
             assert "profile" in result.output.lower()  # Shows profile help
             mock_run_dbt.assert_not_called()
 
-    def test_cached_project_path_used_on_subsequent_calls(self, tmp_path: Path, monkeypatch: MagicMock):
+    def test_cached_project_path_used_on_subsequent_calls(
+        self, tmp_path: Path, monkeypatch: MagicMock, click_app: click.Command
+    ):
         """Test that cached project path is used when --project not provided."""
         cache_dir = tmp_path / ".cache" / "brix"
         monkeypatch.setattr(passthrough_module, "CACHE_DIR", cache_dir)
@@ -172,13 +168,20 @@ class TestDbtCommand:
         project_dir = tmp_path / "my_project"
         project_dir.mkdir()
 
+        calls: list[tuple[list[str], Path | None]] = []
+
+        def record_run_dbt(args: list[str], project_path: Path | None = None) -> int:
+            calls.append((args, project_path))
+            return 0
+
+        monkeypatch.setattr(dbt_command_module, "run_dbt", record_run_dbt)
+
         # First call with --project to cache it
-        with patch.object(dbt_command_module, "run_dbt", return_value=0):
-            result = runner.invoke(app, ["dbt", "--project", str(project_dir), "run"])
-            assert result.exit_code == 0
+        result = runner.invoke(click_app, ["dbt", "--project", str(project_dir), "run"])
+        assert result.exit_code == 0
 
         # Second call without --project should use cached path
-        with patch.object(dbt_command_module, "run_dbt", return_value=0) as mock_run_dbt:
-            result = runner.invoke(app, ["dbt", "run"])
-            mock_run_dbt.assert_called_once_with(["run"], project_path=project_dir.resolve())
-            assert result.exit_code == 0
+        result = runner.invoke(click_app, ["dbt", "run"])
+        assert result.exit_code == 0
+        assert len(calls) == 2
+        assert calls[1] == (["run"], project_dir.resolve())
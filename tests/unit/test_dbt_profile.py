@@ -1,12 +1,12 @@
 """Tests for dbt profile commands and models."""
 
+import re
 from pathlib import Path
-from unittest.mock import patch
 
+import click
 import pytest
-from typer.testing import CliRunner
+from click.testing import CliRunner, Result
 
-from brix.main import app
 from brix.modules.dbt.profile import (
     DatabricksOutput,
     DbtProfiles,
@@ -16,9 +16,37 @@ from brix.modules.dbt.profile import (
     init_profile,
     load_template,
 )
+from tests.unit.helpers import invoke_profile_init, invoke_profile_show
 
 runner = CliRunner()
 
+# Expected validation errors, compiled once for pytest.raises(match=...)
+_ERR_TOKEN_WITH_OAUTH = re.compile("Cannot use token authentication with OAuth")
+_ERR_INCOMPLETE_CLIENT = re.compile("Both client_id and client_secret are required")
+_ERR_INCOMPLETE_AZURE = re.compile("Both azure_client_id and azure_client_secret are required")
+_ERR_MIXED_OAUTH = re.compile("Cannot mix AWS/GCP and Azure OAuth")
+_ERR_OAUTH_WITHOUT_AUTH_TYPE = re.compile("OAuth credentials require auth_type='oauth'")
+_ERR_THREADS = re.compile("threads must be at least 1")
+_ERR_CONNECT_RETRIES = re.compile("connect_retries must be non-negative")
+
+
+@pytest.fixture(autouse=True)
+def clean_brix_env(monkeypatch):
+    """Make sure a BRIX_DBT_PROFILE_PATH from the outer environment does not leak into tests."""
+    monkeypatch.delenv("BRIX_DBT_PROFILE_PATH", raising=False)
+
+
+@pytest.fixture(scope="session")
+def profile_help(click_app: click.Command) -> Result:
+    """Render `brix dbt profile --help` once for all tests that inspect it."""
+    return runner.invoke(click_app, ["dbt", "profile", "--help"], catch_exceptions=False)
+
+
+@pytest.fixture(scope="session")
+def profile_init_help(click_app: click.Command) -> Result:
+    """Render `brix dbt profile init --help` once for all tests that inspect it."""
+    return runner.invoke(click_app, ["dbt", "profile", "init", "--help"], catch_exceptions=False)
+
 
 class TestDbtProfiles:
     """Tests for DbtProfiles pydantic model."""
@@ -50,6 +78,14 @@ default:
         with pytest.raises(ValueError, match="must be a YAML mapping"):
             DbtProfiles.from_yaml("- list item")
 
+    def test_from_file_parses_utf8_bytes(self, tmp_path):
+        """Test from_file hands raw bytes to the parser, including non-ASCII content."""
+        profile_path = tmp_path / "profiles.yml"
+        profile_path.write_bytes("café:\n  target: dev\n  outputs:\n    dev:\n      type: duckdb\n".encode())
+        profiles = DbtProfiles.from_file(profile_path)
+        assert "café" in profiles
+        assert profiles == DbtProfiles.from_yaml(profile_path.read_text(encoding="utf-8"))
+
     def test_to_yaml_roundtrip(self):
         yaml_content = """
 default:
@@ -278,84 +314,60 @@ databricks_project:
         )
         assert output.http_path == "/sql/1.0/warehouses/abc123"
 
-    def test_auth_error_token_with_oauth(self):
-        """Test that token + auth_type raises error."""
-        with pytest.raises(ValueError, match="Cannot use token authentication with OAuth"):
-            DatabricksOutput(
-                type="databricks",
-                schema="my_schema",
-                host="myorg.databricks.com",
-                http_path="/sql/1.0/warehouses/abc123",
-                token="dapi123",  # noqa: S106
-                auth_type="oauth",
-            )
-
-    def test_auth_error_token_with_client_id(self):
-        """Test that token + client_id raises error."""
-        with pytest.raises(ValueError, match="Cannot use token authentication with OAuth"):
+    @pytest.mark.parametrize(
+        ("auth_kwargs", "match"),
+        [
+            pytest.param(
+                {"token": "dapi123", "auth_type": "oauth"},
+                _ERR_TOKEN_WITH_OAUTH,
+                id="token_with_oauth",
+            ),
+            pytest.param(
+                {"token": "dapi123", "client_id": "some-client"},
+                _ERR_TOKEN_WITH_OAUTH,
+                id="token_with_client_id",
+            ),
+            pytest.param(
+                {"auth_type": "oauth", "client_id": "my-client-id"},
+                _ERR_INCOMPLETE_CLIENT,
+                id="incomplete_client_creds",
+            ),
+            pytest.param(
+                {"auth_type": "oauth", "azure_client_id": "azure-client"},
+                _ERR_INCOMPLETE_AZURE,
+                id="incomplete_azure_creds",
+            ),
+            pytest.param(
+                {
+                    "auth_type": "oauth",
+                    "client_id": "aws-client",
+                    "client_secret": "aws-secret",
+                    "azure_client_id": "azure-client",
+                },
+                _ERR_MIXED_OAUTH,
+                id="mixed_client_and_azure",
+            ),
+            pytest.param(
+                {"client_id": "my-client"},
+                _ERR_OAUTH_WITHOUT_AUTH_TYPE,
+                id="client_without_auth_type",
+            ),
+        ],
+    )
+    def test_auth_error(self, auth_kwargs, match):
+        """Test that invalid authentication combinations raise errors."""
+        with pytest.raises(ValueError, match=match):
             DatabricksOutput(
                 type="databricks",
                 schema="my_schema",
                 host="myorg.databricks.com",
                 http_path="/sql/1.0/warehouses/abc123",
-                token="dapi123",  # noqa: S106
-                client_id="some-client",
-            )
-
-    def test_auth_error_incomplete_client_creds(self):
-        """Test that incomplete client credentials raises error."""
-        with pytest.raises(ValueError, match="Both client_id and client_secret are required"):
-            DatabricksOutput(
-                type="databricks",
-                schema="my_schema",
-                host="myorg.databricks.com",
-                http_path="/sql/1.0/warehouses/abc123",
-                auth_type="oauth",
-                client_id="my-client-id",
-                # missing client_secret
-            )
-
-    def test_auth_error_incomplete_azure_creds(self):
-        """Test that incomplete Azure credentials raises error."""
-        with pytest.raises(ValueError, match="Both azure_client_id and azure_client_secret are required"):
-            DatabricksOutput(
-                type="databricks",
-                schema="my_schema",
-                host="myorg.databricks.com",
-                http_path="/sql/1.0/warehouses/abc123",
-                auth_type="oauth",
-                azure_client_id="azure-client",
-                # missing azure_client_secret
-            )
-
-    def test_auth_error_mixed_client_and_azure(self):
-        """Test that mixing AWS/GCP and Azure credentials raises error."""
-        with pytest.raises(ValueError, match="Cannot mix AWS/GCP and Azure OAuth"):
-            DatabricksOutput(
-                type="databricks",
-                schema="my_schema",
-                host="myorg.databricks.com",
-                http_path="/sql/1.0/warehouses/abc123",
-                auth_type="oauth",
-                client_id="aws-client",
-                client_secret="aws-secret",  # noqa: S106
-                azure_client_id="azure-client",
-            )
-
-    def test_auth_error_client_without_auth_type(self):
-        """Test that client credentials without auth_type raises error."""
-        with pytest.raises(ValueError, match="OAuth credentials require auth_type='oauth'"):
-            DatabricksOutput(
-                type="databricks",
-                schema="my_schema",
-                host="myorg.databricks.com",
-                http_path="/sql/1.0/warehouses/abc123",
-                client_id="my-client",
+                **auth_kwargs,
             )
 
     def test_threads_validation_error(self):
         """Test that threads < 1 raises error."""
-        with pytest.raises(ValueError, match="threads must be at least 1"):
+        with pytest.raises(ValueError, match=_ERR_THREADS):
             DatabricksOutput(
                 type="databricks",
                 schema="my_schema",
@@ -367,7 +379,7 @@ databricks_project:
 
     def test_connect_retries_validation_error(self):
         """Test that connect_retries < 0 raises error."""
-        with pytest.raises(ValueError, match="connect_retries must be non-negative"):
+        with pytest.raises(ValueError, match=_ERR_CONNECT_RETRIES):
             DatabricksOutput(
                 type="databricks",
                 schema="my_schema",
@@ -437,6 +449,12 @@ class TestLoadTemplate:
         assert "default" in profiles
         assert profiles["default"].target == "dev"
 
+    def test_load_template_returns_independent_copies(self):
+        _, first = load_template()
+        first.root["default"].target = "changed"
+        _, second = load_template()
+        assert second["default"].target == "dev"
+
     def test_load_nonexistent_template_raises(self):
         with pytest.raises(FileNotFoundError):
             load_template("nonexistent.yml")
@@ -446,10 +464,9 @@ class TestGetDefaultProfilePath:
     """Tests for profile path resolution."""
 
     def test_default_path_is_home_dbt(self):
-        with patch.dict("os.environ", {}, clear=True):
-            # Clear any BRIX_DBT_PROFILE_PATH env var
-            path = get_default_profile_path()
-            assert path == Path.home() / ".dbt" / "profiles.yml"
+        # BRIX_DBT_PROFILE_PATH is cleared by the clean_brix_env fixture
+        path = get_default_profile_path()
+        assert path == Path.home() / ".dbt" / "profiles.yml"
 
     def test_env_var_overrides_default(self, tmp_path, monkeypatch):
         custom_path = tmp_path / "custom" / "profiles.yml"
@@ -457,20 +474,24 @@ class TestGetDefaultProfilePath:
         path = get_default_profile_path()
         assert path == custom_path
 
+    def test_env_var_name_case_insensitive(self, tmp_path, monkeypatch):
+        custom_path = tmp_path / "custom" / "profiles.yml"
+        monkeypatch.setenv("brix_dbt_profile_path", str(custom_path))
+        path = get_default_profile_path()
+        assert path == custom_path
+
 
 class TestInitProfile:
     """Tests for profile initialization."""
 
-    def test_init_creates_profile(self, tmp_path):
+    def test_init_creates_profile(self, tmp_path, default_profiles_content):
         profile_path = tmp_path / ".dbt" / "profiles.yml"
         result = init_profile(profile_path=profile_path)
 
         assert result.success
         assert result.action == "created"
-        assert profile_path.exists()
-        # Verify content is valid
-        profiles = DbtProfiles.from_file(profile_path)
-        assert "default" in profiles
+        # Template validity is covered by TestLoadTemplate; only check it was written verbatim
+        assert profile_path.read_text() == default_profiles_content
 
     def test_init_creates_parent_directories(self, tmp_path):
         profile_path = tmp_path / "deep" / "nested" / "dir" / "profiles.yml"
@@ -486,7 +507,7 @@ class TestInitProfile:
         with pytest.raises(ProfileExistsError, match="already exists"):
             init_profile(profile_path=profile_path)
 
-    def test_init_force_overwrites(self, tmp_path):
+    def test_init_force_overwrites(self, tmp_path, default_profiles_content):
         profile_path = tmp_path / "profiles.yml"
         profile_path.write_text("old content")
 
@@ -494,70 +515,67 @@ class TestInitProfile:
 
         assert result.success
         assert result.action == "overwritten"
-        # Verify new content
-        content = profile_path.read_text()
-        assert "duckdb" in content
+        assert profile_path.read_text() == default_profiles_content
 
 
 class TestProfileCommand:
     """Tests for the profile CLI commands."""
 
-    def test_profile_help(self):
-        result = runner.invoke(app, ["dbt", "profile", "--help"])
-        assert result.exit_code == 0
-        assert "init" in result.output
-        assert "show" in result.output
+    def test_profile_help(self, profile_help):
+        assert profile_help.exit_code == 0
+        assert "init" in profile_help.output
+        assert "show" in profile_help.output
 
-    def test_profile_init_help(self):
-        result = runner.invoke(app, ["dbt", "profile", "init", "--help"])
-        assert result.exit_code == 0
+    def test_profile_init_help(self, profile_init_help):
+        assert profile_init_help.exit_code == 0
         # Check for short options as Rich formatting may wrap/truncate long options
-        assert "-p" in result.output
-        assert "-f" in result.output
+        assert "-p" in profile_init_help.output
+        assert "-f" in profile_init_help.output
 
-    def test_profile_init_creates_file(self, tmp_path):
+    def test_profile_init_creates_file(self, tmp_path, capsys, default_profiles_content):
         profile_path = tmp_path / "profiles.yml"
-        result = runner.invoke(app, ["dbt", "profile", "init", "-p", str(profile_path)])
+        result = invoke_profile_init(capsys, profile_path)
 
         assert result.exit_code == 0
         assert "created" in result.output.lower()
-        assert profile_path.exists()
+        assert profile_path.read_text() == default_profiles_content
 
-    def test_profile_init_fails_if_exists(self, tmp_path):
+    def test_profile_init_fails_if_exists(self, tmp_path, capsys):
         profile_path = tmp_path / "profiles.yml"
         profile_path.write_text("existing")
 
-        result = runner.invoke(app, ["dbt", "profile", "init", "-p", str(profile_path)])
+        result = invoke_profile_init(capsys, profile_path)
 
         assert result.exit_code == 1
         assert "already exists" in result.output
 
-    def test_profile_init_force_overwrites(self, tmp_path):
+    def test_profile_init_force_overwrites(self, tmp_path, capsys, default_profiles_content):
         profile_path = tmp_path / "profiles.yml"
         profile_path.write_text("old")
 
-        result = runner.invoke(app, ["dbt", "profile", "init", "-p", str(profile_path), "--force"])
+        result = invoke_profile_init(capsys, profile_path, force=True)
 
         assert result.exit_code == 0
         assert "overwritten" in result.output.lower()
+        assert profile_path.read_text() == default_profiles_content
 
-    def test_profile_show(self, tmp_path, monkeypatch):
+    def test_profile_show(self, tmp_path, monkeypatch, capsys):
         # Create a profile file
         profile_path = tmp_path / "profiles.yml"
         profile_path.write_text("test: content")
         monkeypatch.setenv("BRIX_DBT_PROFILE_PATH", str(profile_path))
 
-        result = runner.invoke(app, ["dbt", "profile", "show"])
+        result = invoke_profile_show(capsys)
 
         assert result.exit_code == 0
         assert "Exists: True" in result.output
         assert "test: content" in result.output
 
-    def test_profile_show_not_exists(self, tmp_path, monkeypatch):
+    def test_profile_show_not_exists(self, tmp_path, monkeypatch, capsys):
         profile_path = tmp_path / "nonexistent" / "profiles.yml"
         monkeypatch.setenv("BRIX_DBT_PROFILE_PATH", str(profile_path))
 
-        result = runner.invoke(app, ["dbt", "profile", "show"])
+        result = invoke_profile_show(capsys)
 
         assert result.exit_code == 0
         assert "Exists: False" in result.output
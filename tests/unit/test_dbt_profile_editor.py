@@ -1,9 +1,11 @@
 """Tests for dbt profile editor CRUD operations."""
 
+import pickle
+
 import pytest
-from typer.testing import CliRunner
+from click.testing import CliRunner
 
-from brix.main import app
+from brix.commands.dbt import profile as profile_commands
 from brix.modules.dbt.profile import (
     DbtProfiles,
     DuckDbOutput,
@@ -23,14 +25,11 @@ from brix.modules.dbt.profile import (
     update_output,
     update_profile_target,
 )
+from tests.unit.helpers import invoke_profile_edit
 
 runner = CliRunner()
 
-
-@pytest.fixture
-def sample_profiles():
-    """Create sample profiles for testing."""
-    yaml_content = """
+SAMPLE_PROFILES_YAML = """
 default:
   target: dev
   outputs:
@@ -50,14 +49,51 @@ other:
       path: staging.duckdb
       threads: 2
 """
-    return DbtProfiles.from_yaml(yaml_content)
+
+
+@pytest.fixture(scope="session")
+def sample_profiles_template():
+    """Parse the sample profiles once; tests get fresh copies via sample_profiles."""
+    return DbtProfiles.from_yaml(SAMPLE_PROFILES_YAML)
+
+
+@pytest.fixture(scope="session")
+def sample_profiles_yaml_bytes(sample_profiles_template):
+    """Serialize and encode the sample profiles once for tests that need them on disk."""
+    return sample_profiles_template.to_yaml().encode()
+
+
+@pytest.fixture(scope="session")
+def sample_profiles_pickle(sample_profiles_template):
+    """Pickle the sample profiles once; unpickling is a cheaper deep copy than model_copy."""
+    return pickle.dumps(sample_profiles_template)
 
 
 @pytest.fixture
-def profiles_file(tmp_path, sample_profiles):
+def sample_profiles(sample_profiles_pickle):
+    """Create sample profiles for testing (a fresh copy, safe to mutate)."""
+    return pickle.loads(sample_profiles_pickle)  # noqa: S301 - bytes pickled by the fixture above
+
+
+@pytest.fixture
+def saved_profiles(monkeypatch):
+    """Record the profiles each edit command saves, so tests can check them without reparsing the file."""
+    saved = []
+    original_save_profiles = profile_commands.save_profiles
+
+    def record_save_profiles(profiles, path):
+        original_save_profiles(profiles, path)
+        saved.append(profiles)
+
+    monkeypatch.setattr(profile_commands, "save_profiles", record_save_profiles)
+    return saved
+
+
+@pytest.fixture
+def profiles_file(fast_tmp, sample_profiles_yaml_bytes):
     """Create a profiles file for testing."""
-    profile_path = tmp_path / "profiles.yml"
-    profile_path.write_text(sample_profiles.to_yaml())
+    profile_path = fast_tmp / "profiles.yml"
+    profile_path.write_bytes(sample_profiles_yaml_bytes)
     return profile_path
 
 
@@ -69,12 +105,12 @@ class TestLoadSaveProfiles:
         assert "default" in profiles.root
         assert "other" in profiles.root
 
-    def test_load_profiles_file_not_found(self, tmp_path):
+    def test_load_profiles_file_not_found(self, fast_tmp):
         with pytest.raises(FileNotFoundError):
-            load_profiles(tmp_path / "nonexistent.yml")
+            load_profiles(fast_tmp / "nonexistent.yml")
 
-    def test_save_profiles(self, tmp_path, sample_profiles):
-        profile_path = tmp_path / "test_profiles.yml"
+    def test_save_profiles(self, fast_tmp, sample_profiles):
+        profile_path = fast_tmp / "test_profiles.yml"
         save_profiles(sample_profiles, profile_path)
 
         assert profile_path.exists()
@@ -93,11 +129,11 @@ class TestGetNames:
 
     def test_get_profile_names(self, sample_profiles):
         names = get_profile_names(sample_profiles)
-        assert set(names) == {"default", "other"}
+        assert names == ["default", "other"]
 
     def test_get_output_names(self, sample_profiles):
         names = get_output_names(sample_profiles, "default")
-        assert set(names) == {"dev", "prod"}
+        assert names == ["dev", "prod"]
 
     def test_get_output_names_profile_not_found(self, sample_profiles):
         with pytest.raises(ProfileNotFoundError):
@@ -115,6 +151,13 @@ class TestAddProfile:
         assert updated.root["new_profile"].target == "dev"
         assert "dev" in updated.root["new_profile"].outputs
 
+    def test_add_profile_reuses_output_instance(self, sample_profiles):
+        """Validated outputs are nested as-is rather than copied and revalidated."""
+        output_config = DuckDbOutput(type="duckdb", path=":memory:", threads=1)
+        updated = add_profile(sample_profiles, "new_profile", "dev", "dev", output_config)
+
+        assert updated.root["new_profile"].outputs["dev"] is output_config
+
     def test_add_profile_already_exists(self, sample_profiles):
         output_config = DuckDbOutput(type="duckdb", path=":memory:", threads=1)
         with pytest.raises(ProfileAlreadyExistsError, match="already exists"):
@@ -170,18 +213,19 @@ class TestAddOutput:
 class TestUpdateOutput:
     """Tests for updating outputs."""
 
-    def test_update_output_path(self, sample_profiles):
-        updated = update_output(sample_profiles, "default", "dev", path="new_path.duckdb")
-        assert updated.root["default"].outputs["dev"].path == "new_path.duckdb"
-
-    def test_update_output_threads(self, sample_profiles):
-        updated = update_output(sample_profiles, "default", "dev", threads=8)
-        assert updated.root["default"].outputs["dev"].threads == 8
-
-    def test_update_output_both(self, sample_profiles):
-        updated = update_output(sample_profiles, "default", "dev", path="both.duckdb", threads=16)
-        assert updated.root["default"].outputs["dev"].path == "both.duckdb"
-        assert updated.root["default"].outputs["dev"].threads == 16
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"path": "new_path.duckdb"}, id="path"),
+            pytest.param({"threads": 8}, id="threads"),
+            pytest.param({"path": "both.duckdb", "threads": 16}, id="both"),
+        ],
+    )
+    def test_update_output(self, sample_profiles, fields):
+        updated = update_output(sample_profiles, "default", "dev", **fields)
+        output = updated.root["default"].outputs["dev"]
+        for field, value in fields.items():
+            assert getattr(output, field) == value
 
     def test_update_output_profile_not_found(self, sample_profiles):
         with pytest.raises(ProfileNotFoundError):
@@ -239,32 +283,17 @@ class TestGetOutput:
 class TestEditCommand:
     """Tests for the edit CLI command."""
 
-    def test_edit_help(self):
-        result = runner.invoke(app, ["dbt", "profile", "edit", "--help"])
+    def test_edit_help(self, click_app):
+        result = runner.invoke(click_app, ["dbt", "profile", "edit", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "action" in result.output.lower()
         assert "add-profile" in result.output
 
-    def test_add_profile_cli(self, tmp_path):
-        profile_path = tmp_path / "profiles.yml"
+    def test_add_profile_cli(self, fast_tmp, capsys):
+        profile_path = fast_tmp / "profiles.yml"
 
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profile_path),
-                "--action",
-                "add-profile",
-                "--profile",
-                "myproj",
-                "--target",
-                "dev",
-                "--path",
-                "./data.duckdb",
-            ],
+        result = invoke_profile_edit(
+            capsys, profile_path, "add-profile", profile="myproj", target="dev", path_value="./data.duckdb"
         )
 
         assert result.exit_code == 0
@@ -275,11 +304,11 @@ class TestEditCommand:
         assert "myproj" in profiles.root
         assert profiles.root["myproj"].target == "dev"
 
-    def test_add_profile_cli_missing_profile(self, tmp_path):
-        profile_path = tmp_path / "profiles.yml"
+    def test_add_profile_cli_missing_profile(self, fast_tmp, click_app):
+        profile_path = fast_tmp / "profiles.yml"
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
@@ -294,135 +323,60 @@ class TestEditCommand:
         assert result.exit_code == 1
         assert "--profile is required" in result.output
 
-    def test_edit_profile_cli(self, profiles_file):
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profiles_file),
-                "--action",
-                "edit-profile",
-                "--profile",
-                "default",
-                "--target",
-                "production",
-            ],
-        )
+    def test_edit_profile_cli(self, profiles_file, capsys, saved_profiles):
+        result = invoke_profile_edit(capsys, profiles_file, "edit-profile", profile="default", target="production")
 
         assert result.exit_code == 0
         assert "Updated profile" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert profiles.root["default"].target == "production"
 
-    def test_delete_profile_cli_with_force(self, profiles_file):
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profiles_file),
-                "--action",
-                "delete-profile",
-                "--profile",
-                "other",
-                "--force",
-            ],
-        )
+    def test_delete_profile_cli_with_force(self, profiles_file, capsys, saved_profiles):
+        result = invoke_profile_edit(capsys, profiles_file, "delete-profile", profile="other", force=True)
 
         assert result.exit_code == 0
         assert "Deleted profile" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert "other" not in profiles.root
 
-    def test_add_output_cli(self, profiles_file):
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profiles_file),
-                "--action",
-                "add-output",
-                "--profile",
-                "default",
-                "--output",
-                "test",
-                "--path",
-                "./test.duckdb",
-                "--threads",
-                "2",
-            ],
+    def test_add_output_cli(self, profiles_file, capsys, saved_profiles):
+        result = invoke_profile_edit(
+            capsys, profiles_file, "add-output", profile="default", output="test", path_value="./test.duckdb", threads=2
         )
 
         assert result.exit_code == 0
         assert "Added output" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert "test" in profiles.root["default"].outputs
 
-    def test_edit_output_cli(self, profiles_file):
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profiles_file),
-                "--action",
-                "edit-output",
-                "--profile",
-                "default",
-                "--output",
-                "dev",
-                "--path",
-                "./updated.duckdb",
-            ],
+    def test_edit_output_cli(self, profiles_file, capsys, saved_profiles):
+        result = invoke_profile_edit(
+            capsys, profiles_file, "edit-output", profile="default", output="dev", path_value="./updated.duckdb"
         )
 
         assert result.exit_code == 0
         assert "Updated output" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert profiles.root["default"].outputs["dev"].path == "./updated.duckdb"
 
-    def test_delete_output_cli_with_force(self, profiles_file):
-        result = runner.invoke(
-            app,
-            [
-                "dbt",
-                "profile",
-                "edit",
-                "-p",
-                str(profiles_file),
-                "--action",
-                "delete-output",
-                "--profile",
-                "default",
-                "--output",
-                "prod",
-                "--force",
-            ],
+    def test_delete_output_cli_with_force(self, profiles_file, capsys, saved_profiles):
+        result = invoke_profile_edit(
+            capsys, profiles_file, "delete-output", profile="default", output="prod", force=True
         )
 
         assert result.exit_code == 0
         assert "Deleted output" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert "prod" not in profiles.root["default"].outputs
 
-    def test_profile_not_found_error(self, profiles_file):
+    def test_profile_not_found_error(self, profiles_file, click_app):
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
@@ -441,10 +395,10 @@ class TestEditCommand:
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    def test_delete_target_output_with_fallback(self, profiles_file):
+    def test_delete_target_output_with_fallback(self, profiles_file, click_app, saved_profiles):
         """Test deleting the current target output with --target to specify fallback."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
@@ -461,20 +415,21 @@ class TestEditCommand:
                 "prod",  # fallback to prod
                 "--force",
             ],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "Changed target to 'prod'" in result.output
         assert "Deleted output 'dev'" in result.output
 
-        profiles = load_profiles(profiles_file)
+        profiles = saved_profiles[-1]
         assert "dev" not in profiles.root["default"].outputs
         assert profiles.root["default"].target == "prod"
 
-    def test_delete_target_output_force_without_fallback_fails(self, profiles_file):
+    def test_delete_target_output_force_without_fallback_fails(self, profiles_file, click_app):
         """Test that deleting target output with --force but no --target fails."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
@@ -495,10 +450,10 @@ class TestEditCommand:
         assert "Cannot delete target output" in result.output
         assert "--target for fallback" in result.output
 
-    def test_delete_target_output_invalid_fallback_fails(self, profiles_file):
+    def test_delete_target_output_invalid_fallback_fails(self, profiles_file, click_app):
         """Test that specifying an invalid fallback target fails."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
@@ -520,10 +475,10 @@ class TestEditCommand:
         assert result.exit_code == 1
         assert "not a valid output" in result.output
 
-    def test_delete_only_target_output_fails(self, profiles_file):
+    def test_delete_only_target_output_fails(self, profiles_file, click_app):
         """Test that deleting the only output (which is also the target) fails."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "profile",
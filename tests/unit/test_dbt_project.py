@@ -4,9 +4,8 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
+from click.testing import CliRunner
 
-from brix.main import app
 from brix.modules.dbt.project.models import (
     DbtPackages,
     DbtProject,
@@ -28,9 +27,9 @@ runner = CliRunner()
 class TestProjectNameValidation:
     """Tests for project name validation."""
 
-    def test_valid_project_names(self):
-        """Test that valid project names pass validation."""
-        valid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "my_project",
             "MyProject",
             "_private",
@@ -38,23 +37,27 @@ class TestProjectNameValidation:
             "a",
             "_",
             "my_dbt_project_v2",
-        ]
-        for name in valid_names:
-            assert validate_project_name(name) == name
+        ],
+    )
+    def test_valid_project_name(self, name):
+        """Test that valid project names pass validation."""
+        assert validate_project_name(name) == name
 
-    def test_invalid_project_names(self):
-        """Test that invalid project names raise errors."""
-        invalid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "my-project",  # hyphens not allowed
             "123project",  # can't start with number
             "my project",  # spaces not allowed
             "my.project",  # dots not allowed
             "",  # empty not allowed
             "project@name",  # special chars not allowed
-        ]
-        for name in invalid_names:
-            with pytest.raises(ProjectNameError):
-                validate_project_name(name)
+        ],
+    )
+    def test_invalid_project_name(self, name):
+        """Test that invalid project names raise errors."""
+        with pytest.raises(ProjectNameError):
+            validate_project_name(name)
 
 
 class TestDbtProject:
@@ -352,22 +355,22 @@ class TestInitProject:
 class TestProjectCli:
     """Tests for project CLI commands."""
 
-    def test_project_init_help(self):
+    def test_project_init_help(self, click_app):
         """Test that project init --help works."""
-        result = runner.invoke(app, ["dbt", "project", "init", "--help"])
+        result = runner.invoke(click_app, ["dbt", "project", "init", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "Initialize a new dbt project" in result.stdout
 
-    def test_project_init_requires_profile_in_cli_mode(self):
+    def test_project_init_requires_profile_in_cli_mode(self, click_app):
         """Test that --profile is required when --project-name is given."""
-        result = runner.invoke(app, ["dbt", "project", "init", "-n", "test_project"])
+        result = runner.invoke(click_app, ["dbt", "project", "init", "-n", "test_project"])
         assert result.exit_code == 1
         assert "--profile is required" in result.stdout
 
-    def test_project_init_cli_mode(self, tmp_path):
+    def test_project_init_cli_mode(self, tmp_path, click_app):
         """Test CLI mode project initialization."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "project",
@@ -380,15 +383,16 @@ class TestProjectCli:
                 "default",
                 "--no-run-deps",
             ],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert "Project created" in result.stdout or "Project initialization complete" in result.stdout
         assert (tmp_path / "test_cli_project" / "dbt_project.yml").exists()
 
-    def test_project_init_with_team(self, tmp_path):
+    def test_project_init_with_team(self, tmp_path, click_app):
         """Test CLI mode with team option."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "project",
@@ -403,14 +407,15 @@ class TestProjectCli:
                 "default",
                 "--no-run-deps",
             ],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
         assert (tmp_path / "data_team" / "my_project" / "dbt_project.yml").exists()
 
-    def test_project_init_invalid_name(self, tmp_path):
+    def test_project_init_invalid_name(self, tmp_path, click_app):
         """Test that invalid project name fails."""
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "dbt",
                 "project",
@@ -2,21 +2,39 @@
 
 import json
 import logging
+from collections.abc import Callable
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
 from unittest.mock import patch
 
-from typer.testing import CliRunner
+import click
+import pytest
+from click.testing import CliRunner, Result
 
-from brix.main import app
+import brix.utils.logging as brix_logging
 from brix.utils.logging import (
     BrixFormatter,
     BrixJsonFormatter,
+    BufferedFileHandler,
     LogConfig,
     LogLevel,
     get_logger,
+    reset_logger,
     setup_logging,
 )
 
 
+@pytest.fixture(scope="module")
+def record_factory() -> Callable[..., logging.LogRecord]:
+    """Build log records through Logger.makeRecord instead of spelling out every LogRecord field."""
+    logger = logging.getLogger("test-fmt")
+
+    def make(level: int, msg: str, args: tuple = (), exc_info=None) -> logging.LogRecord:
+        return logger.makeRecord("test", level, "", 0, msg, args, exc_info)
+
+    return make
+
+
 class TestLogLevel:
     def test_trace_below_debug(self):
         assert LogLevel.TRACE < LogLevel.DEBUG
@@ -34,83 +52,96 @@ class TestLogLevel:
 class TestLogConfig:
     def test_defaults(self):
         with patch.dict("os.environ", {}, clear=True):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log == "ERROR"
             assert config.log_path is None
             assert config.log_json is False
 
     def test_env_var_log_level(self):
         with patch.dict("os.environ", {"BRIX_LOG": "DEBUG"}):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log == "DEBUG"
 
     def test_env_var_case_insensitive(self):
         with patch.dict("os.environ", {"BRIX_LOG": "debug"}):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log == "DEBUG"
 
     def test_env_var_log_path(self, tmp_path):
         log_path = tmp_path / "test.log"
         with patch.dict("os.environ", {"BRIX_LOG_PATH": str(log_path)}):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log_path == log_path
 
     def test_env_var_log_json(self):
         with patch.dict("os.environ", {"BRIX_LOG_JSON": "true"}):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log_json is True
 
     def test_warning_alias(self):
         with patch.dict("os.environ", {"BRIX_LOG": "WARNING"}):
-            config = LogConfig()
+            config = LogConfig.from_env()
             assert config.log == "WARN"
 
+    def test_env_var_names_case_insensitive(self):
+        with patch.dict("os.environ", {"brix_log": "info", "Brix_Log_Json": "yes"}, clear=True):
+            config = LogConfig.from_env()
+            assert config.log == "INFO"
+            assert config.log_json is True
+
+    def test_invalid_log_level_raises(self):
+        with patch.dict("os.environ", {"BRIX_LOG": "LOUD"}), pytest.raises(ValueError, match="Invalid BRIX_LOG value"):
+            LogConfig.from_env()
+
+    def test_invalid_log_json_raises(self):
+        with (
+            patch.dict("os.environ", {"BRIX_LOG_JSON": "maybe"}),
+            pytest.raises(ValueError, match="Invalid BRIX_LOG_JSON value"),
+        ):
+            LogConfig.from_env()
+
 
 class TestBrixFormatter:
-    def test_format_output(self):
+    def test_format_output(self, record_factory):
         formatter = BrixFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.DEBUG,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory(logging.DEBUG, "Test message")
         output = formatter.format(record)
         assert "[DEBUG]" in output
         assert "Test message" in output
         assert "[" in output
         assert "]" in output
 
-    def test_format_with_args(self):
+    def test_format_with_args(self, record_factory):
         formatter = BrixFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Hello %s",
-            args=("world",),
-            exc_info=None,
-        )
+        record = record_factory(logging.INFO, "Hello %s", ("world",))
         output = formatter.format(record)
         assert "Hello world" in output
 
+    @pytest.mark.parametrize(
+        "created",
+        [
+            1705314645.123456,
+            1705314645.999999,
+            1705314646.5,
+            1705314646.000001,
+            1676520707.7218266,  # round(created * 1e6) would give .721826
+            1705314645.9999996,  # rounds up into the next second
+            1705314646.0,  # isoformat() drops a zero fraction
+        ],
+    )
+    def test_timestamp_matches_isoformat_across_seconds(self, created):
+        """The cached per-second prefix must not leak into records from another second."""
+        formatter = BrixFormatter()
+        formatter.format(logging.makeLogRecord({"created": 1705314645.0, "msg": "warm"}))
+        record = logging.makeLogRecord({"created": created, "levelname": "INFO", "msg": "tick"})
+        expected = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+        assert formatter.format(record) == f"[{expected}] [INFO] tick"
+
 
 class TestBrixJsonFormatter:
-    def test_json_output(self):
+    def test_json_output(self, record_factory):
         formatter = BrixJsonFormatter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = record_factory(logging.INFO, "Test message")
         output = formatter.format(record)
         data = json.loads(output)
         assert data["@level"] == "INFO"
@@ -118,7 +149,7 @@ class TestBrixJsonFormatter:
         assert "@timestamp" in data
         assert "@module" in data
 
-    def test_json_with_exception(self):
+    def test_json_with_exception(self, record_factory):
         formatter = BrixJsonFormatter()
         try:
             raise ValueError("test error")
@@ -127,15 +158,7 @@ class TestBrixJsonFormatter:
 
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="",
-            lineno=0,
-            msg="Error occurred",
-            args=(),
-            exc_info=exc_info,
-        )
+        record = record_factory(logging.ERROR, "Error occurred", exc_info=exc_info)
         output = formatter.format(record)
         data = json.loads(output)
         assert "@exception" in data
@@ -164,22 +187,48 @@ class TestSetupLogging:
     def test_file_handler(self, tmp_path):
         log_file = tmp_path / "test.log"
         logger = setup_logging(level="DEBUG", log_path=log_file)
-        # Should have console + file handlers
+        # Should have console + queue handlers; the file handler sits behind the queue listener
         assert len(logger.handlers) == 2
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        assert sum(isinstance(h, QueueHandler) for h in logger.handlers) == 1
+        assert brix_logging._listener is not None
+        file_handlers = [h for h in brix_logging._listener.handlers if isinstance(h, logging.FileHandler)]
         assert len(file_handlers) == 1
 
     def test_file_uses_json_by_default(self, tmp_path):
         log_file = tmp_path / "test.log"
-        logger = setup_logging(level="DEBUG", log_path=log_file)
-        file_handler = next(h for h in logger.handlers if isinstance(h, logging.FileHandler))
+        setup_logging(level="DEBUG", log_path=log_file)
+        assert brix_logging._listener is not None
+        file_handler = next(h for h in brix_logging._listener.handlers if isinstance(h, logging.FileHandler))
         assert isinstance(file_handler.formatter, BrixJsonFormatter)
 
+    def test_file_records_written_on_reset(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        logger = setup_logging(level="DEBUG", log_path=log_file)
+        logger.info("hello %s", "file")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        reset_logger()  # stops the listener, draining the queue
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [r["@message"] for r in records] == ["hello file", "failed"]
+        assert "ValueError: boom" in records[1]["@exception"]
+
     def test_json_to_console(self):
         logger = setup_logging(level="DEBUG", json_format=True)
         console_handler = next(h for h in logger.handlers if isinstance(h, logging.StreamHandler))
         assert isinstance(console_handler.formatter, BrixJsonFormatter)
 
+    def test_formatters_shared_across_setups(self, tmp_path):
+        console_formatter = setup_logging(level="DEBUG").handlers[0].formatter
+        reset_logger()
+        setup_logging(level="DEBUG", log_path=tmp_path / "test.log", json_format=False)
+        assert brix_logging._listener is not None
+        file_formatter = brix_logging._listener.handlers[0].formatter
+        assert console_formatter is file_formatter
+        assert isinstance(console_formatter, BrixFormatter)
+
     def test_singleton_pattern(self):
         logger1 = setup_logging(level="DEBUG")
         logger2 = setup_logging(level="ERROR")  # Should return same logger
@@ -187,6 +236,34 @@ class TestSetupLogging:
         assert logger1.level == logging.DEBUG  # First call wins
 
 
+class TestBufferedFileHandler:
+    def test_setup_uses_buffered_file_handler(self, tmp_path):
+        setup_logging(level="DEBUG", log_path=tmp_path / "test.log")
+        assert brix_logging._listener is not None
+        assert any(isinstance(h, BufferedFileHandler) for h in brix_logging._listener.handlers)
+
+    def test_only_errors_flush_immediately(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        handler = BufferedFileHandler(log_file)
+        # Emit directly so no logger level (left over from another test) can filter the records out
+        try:
+            handler.emit(logging.makeLogRecord({"msg": "buffered", "levelno": logging.WARNING}))
+            assert handler.stream is not None
+            assert log_file.read_text() == ""
+
+            handler.emit(logging.makeLogRecord({"msg": "flushed", "levelno": logging.ERROR}))
+            assert log_file.read_text().splitlines() == ["buffered", "flushed"]
+        finally:
+            handler.close()
+
+    def test_close_writes_buffered_records(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        handler = BufferedFileHandler(log_file)
+        handler.emit(logging.makeLogRecord({"msg": "pending", "levelno": logging.INFO}))
+        handler.close()
+        assert log_file.read_text() == "pending\n"
+
+
 class TestGetLogger:
     def test_get_logger_initializes(self):
         with patch.dict("os.environ", {}, clear=True):
@@ -199,27 +276,38 @@ class TestGetLogger:
         logger2 = get_logger()
         assert logger1 is logger2
 
+    @pytest.mark.parametrize("level", ["OFF", "ERROR"])
+    def test_disabled_debug_fast_path(self, level, monkeypatch):
+        """The brix logger carries its own level, so level checks never consult the parent chain."""
+        logger = setup_logging(level=level)
+        # A lookup through the (now missing) parent would resolve to NOTSET and enable DEBUG
+        monkeypatch.setattr(logger, "parent", None)
+        assert logger.isEnabledFor(logging.DEBUG) is False
+
 
 # Disable Rich/ANSI colors for consistent CI output
 _CLI_ENV = {"NO_COLOR": "1", "TERM": "dumb"}
 
 
+@pytest.fixture(scope="session")
+def app_help(click_app: click.Command) -> Result:
+    """Render `brix --help` once for all tests that inspect it."""
+    return CliRunner(mix_stderr=False).invoke(click_app, ["--help"], env=_CLI_ENV)
+
+
 class TestCliIntegration:
     runner = CliRunner(mix_stderr=False)
 
-    def test_log_level_option_shows_in_help(self):
-        result = self.runner.invoke(app, ["--help"], env=_CLI_ENV)
-        assert result.exit_code == 0
-        assert "--log-level" in result.output
+    def test_log_level_option_shows_in_help(self, app_help):
+        assert app_help.exit_code == 0
+        assert "--log-level" in app_help.output
 
-    def test_log_path_option_shows_in_help(self):
-        result = self.runner.invoke(app, ["--help"], env=_CLI_ENV)
-        assert "--log-path" in result.output
+    def test_log_path_option_shows_in_help(self, app_help):
+        assert "--log-path" in app_help.output
 
-    def test_log_json_option_shows_in_help(self):
-        result = self.runner.invoke(app, ["--help"], env=_CLI_ENV)
-        assert "--log-json" in result.output
+    def test_log_json_option_shows_in_help(self, app_help):
+        assert "--log-json" in app_help.output
 
-    def test_cli_with_log_level(self):
-        result = self.runner.invoke(app, ["--log-level", "DEBUG"], env=_CLI_ENV)
+    def test_cli_with_log_level(self, click_app):
+        result = self.runner.invoke(click_app, ["--log-level", "DEBUG"], env=_CLI_ENV)
         assert result.exit_code == 0
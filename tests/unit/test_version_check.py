@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import httpx
+import pytest
 import respx
 
 from brix import version_check
@@ -17,6 +18,22 @@ from brix.version_check import (
     check_for_updates,
 )
 
+_RELEASES_URL = "https://api.github.com/repos/Spycner/brix/releases/latest"
+
+
+@pytest.fixture
+def gh_releases_route():
+    """Mock the GitHub latest-release endpoint; tests set the response on the returned route."""
+    with respx.mock:
+        yield respx.get(_RELEASES_URL)
+
+
+def _prime_cache(monkeypatch, *, version, when=None):
+    """Make _load_cache return an in-memory cache instead of reading the cache file."""
+    cache = VersionCache(last_check=when or datetime.now(timezone.utc), latest_version=version)
+    monkeypatch.setattr(version_check, "_load_cache", lambda: cache)
+    return cache
+
 
 class TestVersionCache:
     def test_valid_cache(self):
@@ -84,45 +101,33 @@ class TestShouldRefresh:
 
 
 class TestFetchAndCacheLatest:
-    @respx.mock
-    def test_successful_fetch(self, temp_cache_dir):
-        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
-            return_value=httpx.Response(200, json={"tag_name": "v2.0.0"})
-        )
+    def test_successful_fetch(self, temp_cache_dir, gh_releases_route):
+        gh_releases_route.mock(return_value=httpx.Response(200, json={"tag_name": "v2.0.0"}))
         _fetch_and_cache_latest()
+        assert gh_releases_route.call_count == 1
         cache = _load_cache()
         assert cache is not None
         assert cache.latest_version == "2.0.0"
 
-    @respx.mock
-    def test_strips_v_prefix(self, temp_cache_dir):
-        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
-            return_value=httpx.Response(200, json={"tag_name": "v1.2.3"})
-        )
+    def test_strips_v_prefix(self, temp_cache_dir, gh_releases_route):
+        gh_releases_route.mock(return_value=httpx.Response(200, json={"tag_name": "v1.2.3"}))
         _fetch_and_cache_latest()
         cache = _load_cache()
         assert cache is not None
         assert cache.latest_version == "1.2.3"
 
-    @respx.mock
-    def test_http_error(self, temp_cache_dir):
-        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(return_value=httpx.Response(404))
+    def test_http_error(self, temp_cache_dir, gh_releases_route):
+        gh_releases_route.mock(return_value=httpx.Response(404))
         _fetch_and_cache_latest()
         assert _load_cache() is None
 
-    @respx.mock
-    def test_invalid_response(self, temp_cache_dir):
-        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
-            return_value=httpx.Response(200, json={"no_tag": "here"})
-        )
+    def test_invalid_response(self, temp_cache_dir, gh_releases_route):
+        gh_releases_route.mock(return_value=httpx.Response(200, json={"no_tag": "here"}))
         _fetch_and_cache_latest()
         assert _load_cache() is None
 
-    @respx.mock
-    def test_network_error(self, temp_cache_dir):
-        respx.get("https://api.github.com/repos/Spycner/brix/releases/latest").mock(
-            side_effect=httpx.ConnectError("Connection failed")
-        )
+    def test_network_error(self, temp_cache_dir, gh_releases_route):
+        gh_releases_route.mock(side_effect=httpx.ConnectError("Connection failed"))
         _fetch_and_cache_latest()  # Should not raise
         assert _load_cache() is None
 
@@ -133,37 +138,41 @@ class TestCheckForUpdates:
             result = check_for_updates()
         assert result is None
 
-    def test_update_available(self, temp_cache_dir, monkeypatch):
+    def test_update_available(self, monkeypatch):
         monkeypatch.setattr(version_check, "__version__", "1.0.0")
-        cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version="2.0.0")
-        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
-        temp_cache_dir.write_text(cache.model_dump_json())
+        _prime_cache(monkeypatch, version="2.0.0")
         result = check_for_updates()
         assert result == "2.0.0"
 
-    def test_no_update_needed(self, temp_cache_dir, monkeypatch):
+    def test_no_update_needed(self, monkeypatch):
         monkeypatch.setattr(version_check, "__version__", "1.0.0")
-        cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version="1.0.0")
-        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
-        temp_cache_dir.write_text(cache.model_dump_json())
+        _prime_cache(monkeypatch, version="1.0.0")
         result = check_for_updates()
         assert result is None
 
-    def test_installed_version_newer_than_cached(self, temp_cache_dir, monkeypatch):
+    def test_installed_version_newer_than_cached(self, monkeypatch):
         """Ensure no update shown when installed version is newer than cached (e.g., 1.1.0 > 1.0.1)."""
         monkeypatch.setattr(version_check, "__version__", "1.1.0")
-        cache = VersionCache(last_check=datetime.now(timezone.utc), latest_version="1.0.1")
-        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
-        temp_cache_dir.write_text(cache.model_dump_json())
+        _prime_cache(monkeypatch, version="1.0.1")
         result = check_for_updates()
         assert result is None
 
-    def test_spawns_background_thread_when_stale(self, temp_cache_dir, monkeypatch):
+    def test_double_digit_components_compare_numerically(self, monkeypatch):
+        monkeypatch.setattr(version_check, "__version__", "1.9.0")
+        _prime_cache(monkeypatch, version="1.10.0")
+        result = check_for_updates()
+        assert result == "1.10.0"
+
+    def test_non_pep440_cached_version_ignored(self, monkeypatch):
+        monkeypatch.setattr(version_check, "__version__", "1.0.0")
+        _prime_cache(monkeypatch, version="nightly")
+        result = check_for_updates()
+        assert result is None
+
+    def test_spawns_background_thread_when_stale(self, monkeypatch):
         monkeypatch.setattr(version_check, "__version__", "1.0.0")
         old_time = datetime.now(timezone.utc) - CHECK_INTERVAL - timedelta(hours=1)
-        cache = VersionCache(last_check=old_time, latest_version="1.0.0")
-        temp_cache_dir.parent.mkdir(parents=True, exist_ok=True)
-        temp_cache_dir.write_text(cache.model_dump_json())
+        _prime_cache(monkeypatch, version="1.0.0", when=old_time)
 
         with patch.object(version_check, "_fetch_and_cache_latest") as mock_fetch:
             check_for_updates()